@@ -14,6 +14,7 @@ from typing import List
 from argparse import ArgumentParser, ArgumentTypeError, Namespace
 
 from pcluster import utils
+from pcluster.cli.commands.commands import CLI_COMMANDS
 from pcluster.cli.commands.common import CliCommand, ExportLogsCommand
 from pcluster.models.cluster import Cluster
 
@@ -25,7 +26,7 @@ class ExportClusterLogsCommand(ExportLogsCommand, CliCommand):
 
     # CLI
     name = "export-cluster-logs"
-    help = "Export the logs of the cluster to a local tar.gz archive by passing through an Amazon S3 Bucket."
+    help = CLI_COMMANDS[name].help
     description = help
 
     def __init__(self, subparsers):
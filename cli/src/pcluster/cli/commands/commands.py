@@ -9,13 +9,36 @@
 # OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions and
 # limitations under the License.
 
-# pylint: disable=R0801
+from collections import namedtuple
 
-# flake8: noqa
+CliCommandEntry = namedtuple("CliCommandEntry", ["class_path", "help"])
 
-from pcluster.cli.commands.cluster_logs import ExportClusterLogsCommand
-from pcluster.cli.commands.configure.command import ConfigureCommand
-from pcluster.cli.commands.dcv_connect import DcvConnectCommand
-from pcluster.cli.commands.image_logs import ExportImageLogsCommand
-from pcluster.cli.commands.ssh import SshCommand
-from pcluster.cli.commands.version import VersionCommand
+# CLI commands that don't belong to the API, listed in the order they appear in the help. Each entry holds the import
+# path of the CliCommand class of the command and the help displayed in the top level help. The classes are referenced
+# by path rather than imported here so that a command module is only imported when the command is run.
+CLI_COMMANDS = {
+    "configure": CliCommandEntry(
+        "pcluster.cli.commands.configure.command.ConfigureCommand",
+        "Start the AWS ParallelCluster configuration.",
+    ),
+    "dcv-connect": CliCommandEntry(
+        "pcluster.cli.commands.dcv_connect.DcvConnectCommand",
+        "Permits to connect to the head node through an interactive session by using NICE DCV.",
+    ),
+    "export-cluster-logs": CliCommandEntry(
+        "pcluster.cli.commands.cluster_logs.ExportClusterLogsCommand",
+        "Export the logs of the cluster to a local tar.gz archive by passing through an Amazon S3 Bucket.",
+    ),
+    "export-image-logs": CliCommandEntry(
+        "pcluster.cli.commands.image_logs.ExportImageLogsCommand",
+        "Export the logs of the image builder stack to a local tar.gz archive by passing through an Amazon S3 Bucket.",
+    ),
+    "ssh": CliCommandEntry(
+        "pcluster.cli.commands.ssh.SshCommand",
+        "Connects to the head node instance using SSH.",
+    ),
+    "version": CliCommandEntry(
+        "pcluster.cli.commands.version.VersionCommand",
+        "Displays the version of AWS ParallelCluster.",
+    ),
+}
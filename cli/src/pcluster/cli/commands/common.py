@@ -49,6 +49,11 @@ def to_int(param, in_str):
         return exit_msg(f"Bad Request: Wrong type, expected 'int' for parameter '{param}'")
 
 
+def add_flag(parser: ArgumentParser, *name_or_flags: str, help_msg: str, default: bool = False) -> None:
+    """Add to the parser a boolean flag that is set to True when provided."""
+    parser.add_argument(*name_or_flags, action="store_true", default=default, help=help_msg)
+
+
 class CliCommand(ABC):
     """Abstract class for a CLI command."""
 
@@ -56,7 +61,7 @@ class CliCommand(ABC):
         """Initialize a CLI command."""
         parser_name = argparse_kwargs.pop("name")
         parser = subparsers.add_parser(parser_name, **argparse_kwargs)
-        parser.add_argument("--debug", action="store_true", help="Turn on debug logging.", default=False)
+        add_flag(parser, "--debug", help_msg="Turn on debug logging.")
         if region_arg:
             parser.add_argument("-r", "--region", help="AWS Region this operation corresponds to.")
         self.register_command_args(parser)
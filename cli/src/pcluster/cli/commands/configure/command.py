@@ -14,6 +14,7 @@ from typing import List
 
 from argparse import ArgumentParser, Namespace
 
+from pcluster.cli.commands.commands import CLI_COMMANDS
 from pcluster.cli.commands.common import CliCommand
 
 
@@ -22,7 +23,7 @@ class ConfigureCommand(CliCommand):
 
     # CLI
     name = "configure"
-    help = "Start the AWS ParallelCluster configuration."
+    help = CLI_COMMANDS[name].help
     description = help
 
     def __init__(self, subparsers):
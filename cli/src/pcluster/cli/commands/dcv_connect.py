@@ -20,7 +20,8 @@ from typing import List
 
 from argparse import ArgumentParser, Namespace
 
-from pcluster.cli.commands.common import CliCommand
+from pcluster.cli.commands.commands import CLI_COMMANDS
+from pcluster.cli.commands.common import CliCommand, add_flag
 from pcluster.constants import PCLUSTER_ISSUES_LINK
 from pcluster.models.cluster import Cluster
 from pcluster.utils import error
@@ -149,7 +150,7 @@ class DcvConnectCommand(CliCommand):
 
     # CLI
     name = "dcv-connect"
-    help = "Permits to connect to the head node through an interactive session by using NICE DCV."
+    help = CLI_COMMANDS[name].help
     description = help
 
     def __init__(self, subparsers):
@@ -158,7 +159,7 @@ class DcvConnectCommand(CliCommand):
     def register_command_args(self, parser: ArgumentParser) -> None:  # noqa: D102
         parser.add_argument("-n", "--cluster-name", help="Name of the cluster to connect to", required=True)
         parser.add_argument("--key-path", dest="key_path", help="Key path of the SSH key to use for the connection")
-        parser.add_argument("--show-url", action="store_true", default=False, help="Print URL and exit")
+        add_flag(parser, "--show-url", help_msg="Print URL and exit")
 
     def execute(self, args: Namespace, extra_args: List[str]) -> None:  # noqa: D102  #pylint: disable=unused-argument
         _dcv_connect(args)
@@ -15,6 +15,7 @@ from argparse import ArgumentParser, Namespace
 from pcluster import utils
 from pcluster.api.controllers.common import assert_supported_operation
 from pcluster.aws.common import get_region
+from pcluster.cli.commands.commands import CLI_COMMANDS
 from pcluster.cli.commands.common import CliCommand, ExportLogsCommand
 from pcluster.constants import Operation
 from pcluster.models.imagebuilder import ImageBuilder
@@ -27,9 +28,7 @@ class ExportImageLogsCommand(ExportLogsCommand, CliCommand):
 
     # CLI
     name = "export-image-logs"
-    help = (
-        "Export the logs of the image builder stack to a local tar.gz archive by passing through an Amazon S3 Bucket."
-    )
+    help = CLI_COMMANDS[name].help
     description = help
 
     def __init__(self, subparsers):
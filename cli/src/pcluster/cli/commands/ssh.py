@@ -16,7 +16,6 @@
 import json
 import logging
 import os
-import textwrap
 from builtins import str
 from functools import partial
 from typing import List
@@ -24,6 +23,7 @@ from typing import List
 from argparse import ArgumentParser, Namespace, RawDescriptionHelpFormatter
 
 from pcluster import utils
+from pcluster.cli.commands.commands import CLI_COMMANDS
 from pcluster.cli.commands.common import CliCommand, to_bool
 from pcluster.models.cluster import Cluster
 
@@ -73,20 +73,18 @@ class SshCommand(CliCommand):
 
     # CLI
     name = "ssh"
-    help = "Connects to the head node instance using SSH."
+    help = CLI_COMMANDS[name].help
     description = (
         "Run ssh command with the cluster username and IP address pre-populated. "
         "Arbitrary arguments are appended to the end of the ssh command."
     )
-    epilog = textwrap.dedent(
-        """Example:
+    epilog = """Example:
 
   pcluster ssh --cluster-name mycluster -i ~/.ssh/id_rsa
 
 Returns an ssh command with the cluster username and IP address pre-populated:
 
   ssh ec2-user@1.1.1.1 -i ~/.ssh/id_rsa"""
-    )
 
     def __init__(self, subparsers):
         super().__init__(
@@ -12,16 +12,22 @@ from typing import List
 import argparse
 
 from pcluster import utils
+from pcluster.cli.commands.commands import CLI_COMMANDS
 from pcluster.cli.commands.common import CliCommand, print_json
 
 
+def print_version():
+    """Print the version of AWS ParallelCluster."""
+    print_json({"version": utils.get_installed_version()})
+
+
 class VersionCommand(CliCommand):
     """Implement pcluster version command."""
 
     # CLI
     name = "version"
-    help = "Displays the version of AWS ParallelCluster."
-    description = "Displays the version of AWS ParallelCluster."
+    help = CLI_COMMANDS[name].help
+    description = help
 
     def __init__(self, subparsers):
         super().__init__(subparsers, name=self.name, help=self.help, description=self.description, region_arg=False)
@@ -32,4 +38,4 @@ class VersionCommand(CliCommand):
     def execute(  # noqa: D102
         self, args: argparse.Namespace, extra_args: List[str]  # pylint: disable=unused-argument
     ) -> None:
-        print_json({"version": utils.get_installed_version()})
+        print_version()
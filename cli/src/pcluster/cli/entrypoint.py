@@ -12,7 +12,7 @@
 # implied. See the License for the specific language governing permissions and
 # limitations under the License.
 
-import inspect
+import importlib
 import json
 import logging.config
 import os
@@ -28,17 +28,13 @@ os.environ["JSII_SILENCE_WARNING_KNOWN_BROKEN_NODE_VERSION"] = "1"
 os.environ["JSII_SILENCE_WARNING_UNTESTED_NODE_VERSION"] = "1"
 os.environ["JSII_SILENCE_WARNING_DEPRECATED_NODE_VERSION"] = "1"
 
-# Controllers
-import pcluster.api.controllers.cluster_compute_fleet_controller  # noqa: E402
-import pcluster.api.controllers.cluster_instances_controller  # noqa: E402
-import pcluster.api.controllers.cluster_operations_controller  # noqa: E402
-import pcluster.api.controllers.image_operations_controller  # noqa: E402
-import pcluster.api.errors  # noqa: E402
-import pcluster.cli.commands.commands as cli_commands  # noqa: E402
+# Controllers are resolved by name when an operation is called (pcluster.cli.model.call) and the API errors and encoder
+# modules are imported in _run_operation, so that none of them is loaded by commands that don't need them
 import pcluster.cli.logger as pcluster_logging  # noqa: E402
 import pcluster.cli.model  # noqa: E402
-from pcluster.api import encoder  # noqa: E402
-from pcluster.cli.commands.common import CliCommand, exit_msg, to_bool, to_int, to_number  # noqa: E402
+from pcluster.cli.commands.commands import CLI_COMMANDS  # noqa: E402
+from pcluster.cli.commands.common import add_flag, exit_msg, to_bool, to_int, to_number  # noqa: E402
+from pcluster.cli.commands.version import print_version  # noqa: E402
 from pcluster.cli.exceptions import APIOperationException, ParameterException  # noqa: E402
 from pcluster.cli.logger import redirect_stdouterr_to_logger  # noqa: E402
 from pcluster.cli.middleware import add_additional_args, middleware_hooks  # noqa: E402
@@ -46,6 +42,15 @@ from pcluster.utils import to_camel_case, to_snake_case  # noqa: E402
 
 LOGGER = logging.getLogger(__name__)
 
+# Short flags for the parameters shared by most operations
+_ABBREV_ARGS = {
+    "cluster-name": "-n",
+    "image-id": "-i",
+    "region": "-r",
+    "cluster-configuration": "-c",
+    "image-configuration": "-c",
+}
+
 
 def re_validator(rexp_str, param, in_str):
     """Take a string and validate the input format."""
@@ -105,6 +110,7 @@ def dispatch(model, args):
     operation = args.operation
     del args_dict["func"]
     del args_dict["operation"]
+    args_dict.pop("expects_extra_args", None)
     body, kwargs = convert_args(model, operation, args_dict)
 
     dispatch_func = partial(pcluster.cli.model.call, model[operation]["func"])
@@ -141,8 +147,25 @@ def param_coerce(param):
     return coerce_fn
 
 
-def gen_parser(model):
-    """Take a model and returns an ArgumentParser for CLI parsing."""
+def _selected_operations(sys_args):
+    """Return the set of operations whose parsers need to be populated for the given command line.
+
+    Only the operation named by the first argument is needed to parse the command line, so the others are registered
+    by name only. Top level help only needs the names, so no parser is populated. None is returned when the operation
+    cannot be determined up front.
+    """
+    if sys_args and sys_args[0] in ("-h", "--help"):
+        return set()
+    if sys_args and not sys_args[0].startswith("-"):
+        return {sys_args[0]}
+    return None
+
+
+def gen_parser(model, operations=None):
+    """Take a model and returns an ArgumentParser for CLI parsing.
+
+    If operations is provided, only the parsers of the given operations are populated with their arguments.
+    """
     desc = (
         "pcluster is the AWS ParallelCluster CLI and permits "
         "launching and management of HPC clusters in the AWS cloud."
@@ -158,19 +181,14 @@ def gen_parser(model):
         op_help = operation.get("description", f"{op_name} command help")
         subparser = subparsers.add_parser(op_name, help=op_help, description=op_help)
         parser_map[op_name] = subparser
+        if operations is not None and op_name not in operations:
+            continue
 
         for param in operation["params"]:
             help = param.get("description", "")
 
-            abbrev_args = {
-                "cluster-name": "-n",
-                "image-id": "-i",
-                "region": "-r",
-                "cluster-configuration": "-c",
-                "image-configuration": "-c",
-            }
-            if param["name"] in abbrev_args:
-                arg_name = [abbrev_args[param["name"]], f"--{param['name']}"]
+            if param["name"] in _ABBREV_ARGS:
+                arg_name = [_ABBREV_ARGS[param["name"]], f"--{param['name']}"]
             else:
                 arg_name = [f"--{param['name']}"]
 
@@ -184,26 +202,36 @@ def gen_parser(model):
                 help=help,
             )
 
-        subparser.add_argument("--debug", action="store_true", help="Turn on debug logging.", default=False)
+        add_flag(subparser, "--debug", help_msg="Turn on debug logging.")
         subparser.add_argument("--query", help="JMESPath query to perform on output.")
-        subparser.set_defaults(func=partial(dispatch, model))
+        subparser.set_defaults(func=partial(dispatch, model), expects_extra_args=False)
 
     return parser, parser_map
 
 
-def add_cli_commands(parser_map):
+def add_cli_commands(parser_map, operations=None):
     """Add additional CLI arguments that don't belong to the API."""
     subparsers = parser_map["subparser"]
 
-    # add all non-api commands via introspection
-    for _name, obj in inspect.getmembers(cli_commands):
-        if inspect.isclass(obj) and issubclass(obj, CliCommand) and not inspect.isabstract(obj):
-            obj(subparsers)
+    for name, command in CLI_COMMANDS.items():
+        if operations is None or name in operations:
+            # the command may be run: build its full parser
+            module_name, class_name = command.class_path.rsplit(".", 1)
+            getattr(importlib.import_module(module_name), class_name)(subparsers)
+        elif not operations:
+            # top level help: only the name and help of the command are displayed
+            subparsers.add_parser(name, help=command.help)
+        else:
+            # another command is run: its parser is only needed to list the valid command names
+            subparsers.add_parser(name)
 
     add_additional_args(parser_map)
 
 
 def _run_operation(model, args, extra_args):
+    # pylint: disable=import-outside-toplevel
+    from pcluster.api import encoder, errors as api_errors
+
     if args.operation in model:
         try:
             with redirect_stdouterr_to_logger():
@@ -216,15 +244,15 @@ def _run_operation(model, args, extra_args):
             raise e
         except Exception as e:
             # format exception messages in the same manner as the api
-            message = pcluster.api.errors.exception_message(e)
+            message = api_errors.exception_message(e)
             error_encoded = encoder.JSONEncoder().encode(message)
             raise APIOperationException(json.loads(error_encoded))
     else:
         try:
             return args.func(args, extra_args)
-        except pcluster.api.errors.ParallelClusterApiException as e:
+        except api_errors.ParallelClusterApiException as e:
             # Format exception messages in the same manner as the api
-            message = pcluster.api.errors.exception_message(e)
+            message = api_errors.exception_message(e)
             error_encoded = encoder.JSONEncoder().encode(message)
             raise APIOperationException(json.loads(error_encoded))
         except Exception as e:
@@ -232,14 +260,20 @@ def _run_operation(model, args, extra_args):
 
 
 def run(sys_args, model=None):
-    spec = pcluster.cli.model.package_spec()
-    model = model or pcluster.cli.model.load_model(spec)
-    parser, parser_map = gen_parser(model)
-    add_cli_commands(parser_map)
+    if sys_args == ["version"]:
+        # version takes no arguments, so there is no need to load the model and build the parser
+        LOGGER.info("Handling CLI command version")
+        print_version()
+        return None
+
+    model = model or pcluster.cli.model.load_cached_model()
+    operations = _selected_operations(sys_args)
+    parser, parser_map = gen_parser(model, operations)
+    add_cli_commands(parser_map, operations)
     args, extra_args = parser.parse_known_args(sys_args)
 
-    # some commands (e.g. ssh and those defined as CliCommand objects) require 'extra_args'
-    if extra_args and (not hasattr(args, "expects_extra_args") or not args.expects_extra_args):
+    # some commands (e.g. ssh) declare through their parser defaults that they accept 'extra_args'
+    if extra_args and not args.expects_extra_args:
         parser.print_usage()
         print(f"Invalid arguments {extra_args}")
         sys.exit(1)
@@ -51,13 +51,16 @@ def config_logger():
         },
         "loggers": {
             "": {"handlers": ["default"], "level": "WARNING", "propagate": False},  # root logger
-            "pcluster": {"handlers": ["default"], "level": "INFO", "propagate": False},
+            # Records of the pcluster loggers reach the log file through the root logger handler
+            "pcluster": {"level": "INFO", "propagate": True},
         },
     }
     if os.environ.get("PCLUSTER_LOG_TO_STDOUT"):
-        for logger in logging_config["loggers"].values():
-            logger["handlers"] = ["console"]
-    os.makedirs(os.path.dirname(logfile), exist_ok=True)
+        logging_config["loggers"][""]["handlers"] = ["console"]
+    logdir = os.path.dirname(logfile)
+    # os.makedirs raises and swallows an OSError when the directory exists, which is the common case
+    if not os.path.isdir(logdir):
+        os.makedirs(logdir, exist_ok=True)
     logging.config.dictConfig(logging_config)
 
 
@@ -27,6 +27,7 @@ import jmespath
 from botocore.exceptions import WaiterError
 
 import pcluster.cli.model
+from pcluster.cli.commands.common import add_flag
 from pcluster.cli.exceptions import APIOperationException, ParameterException
 
 LOGGER = logging.getLogger(__name__)
@@ -46,9 +47,8 @@ def add_additional_args(parser_map):
     calling the underlying function for the situation where they are not a part
     of the specification.
     """
-    parser_map["create-cluster"].add_argument("--wait", action="store_true", help=argparse.SUPPRESS)
-    parser_map["delete-cluster"].add_argument("--wait", action="store_true", help=argparse.SUPPRESS)
-    parser_map["update-cluster"].add_argument("--wait", action="store_true", help=argparse.SUPPRESS)
+    for operation in ("create-cluster", "delete-cluster", "update-cluster"):
+        add_flag(parser_map[operation], "--wait", help_msg=argparse.SUPPRESS)
 
 
 def middleware_hooks():
@@ -11,14 +11,17 @@
 # implied. See the License for the specific language governing permissions and
 # limitations under the License.
 import functools
+import hashlib
 import importlib
 import json
+import logging
+import os
 
 import jmespath
 
-from pcluster.api import encoder, openapi
+from pcluster.api import openapi
 from pcluster.cli.exceptions import APIOperationException
-from pcluster.utils import to_kebab_case, to_snake_case, yaml_load
+from pcluster.utils import get_installed_version, to_kebab_case, to_snake_case, yaml_load
 
 # For importing package resources
 try:
@@ -26,6 +29,12 @@ try:
 except ImportError:
     import importlib_resources as pkg_resources
 
+LOGGER = logging.getLogger(__name__)
+
+# Version of the data structure returned by load_model, to be bumped whenever it changes in an incompatible way
+MODEL_CACHE_FORMAT = 1
+CONTROLLERS_PACKAGE = "pcluster.api.controllers."
+
 
 def _param_overrides(operation, param):
     """Provide updates to the model that are specific to the CLI."""
@@ -86,10 +95,71 @@ def _resolve_body(spec, operation):
     return new_params
 
 
+def _package_spec_text():
+    with pkg_resources.open_text(openapi, "openapi.yaml") as spec_file:  # pylint: disable=deprecated-method
+        return spec_file.read()
+
+
 def package_spec():
     """Load the OpenAPI specification from the package."""
-    with pkg_resources.open_text(openapi, "openapi.yaml") as spec_file:  # pylint: disable=deprecated-method
-        return yaml_load(spec_file.read())
+    return yaml_load(_package_spec_text())
+
+
+def get_model_cache_file():
+    return os.path.expanduser(os.path.join("~", ".parallelcluster", "pcluster-cli-model.json"))
+
+
+def _model_cache_key(spec_text):
+    """Return the key of a cached model, which depends on the specification and on the code that transforms it."""
+    key_data = f"{MODEL_CACHE_FORMAT}:{get_installed_version()}:{spec_text}"
+    return hashlib.sha256(key_data.encode("utf-8")).hexdigest()
+
+
+def _read_cached_model(cache_file, key):
+    """Return the model cached in the given file if it matches the key, None otherwise."""
+    try:
+        with open(cache_file, encoding="utf-8") as file:
+            cache = json.load(file)
+        model = cache["model"]
+        # The controller functions are imported and called by name, so only accept the ParallelCluster ones
+        if cache["key"] == key and all(op["func"].startswith(CONTROLLERS_PACKAGE) for op in model.values()):
+            return model
+    except (OSError, ValueError, KeyError, TypeError, AttributeError):
+        pass
+    return None
+
+
+def _write_cached_model(cache_file, key, model):
+    tmp_file = f"{cache_file}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(os.path.dirname(cache_file), exist_ok=True)
+        with open(tmp_file, "w", encoding="utf-8") as file:
+            json.dump({"key": key, "model": model}, file)
+        os.replace(tmp_file, cache_file)
+    except (OSError, TypeError, ValueError) as e:
+        LOGGER.debug("Unable to cache the CLI model to %s: %s", cache_file, e)
+        try:
+            os.remove(tmp_file)
+        except OSError:
+            pass
+
+
+def load_cached_model():
+    """Load the model of the packaged specification, reusing the one cached on disk if still valid.
+
+    Parsing the OpenAPI specification dominates the CLI startup time, while the resulting model is plain data that
+    can be stored as JSON. The cache is keyed on the specification, the installed ParallelCluster version and the
+    model format, and is rebuilt when missing, unreadable or stale. Failing to write it is not an error.
+    """
+    spec_text = _package_spec_text()
+    key = _model_cache_key(spec_text)
+    cache_file = get_model_cache_file()
+
+    model = _read_cached_model(cache_file, key)
+    if model is None:
+        model = load_model(yaml_load(spec_text))
+        _write_cached_model(cache_file, key, model)
+    return model
 
 
 def load_model(spec):
@@ -206,6 +276,8 @@ def call(func_str, *args, **kwargs):
     tuple (instead of an object). Also uses the flask json-ifier to ensure data
     is converted the same as the API.
     """
+    from pcluster.api import encoder  # pylint: disable=import-outside-toplevel
+
     query = kwargs.pop("query", None)
     func = get_function_from_name(func_str)
     ret = func(*args, **kwargs)
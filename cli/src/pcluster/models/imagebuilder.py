@@ -18,6 +18,7 @@ import os
 import os.path
 import re
 import tempfile
+import time
 from datetime import datetime
 from typing import Set
 
@@ -697,7 +698,7 @@ class ImageBuilder:
         try:
             with tempfile.TemporaryDirectory() as output_tempdir:
                 # Create root folder for the archive
-                archive_name = f"{self.image_id}-logs-{datetime.now().strftime('%Y%m%d%H%M')}"
+                archive_name = f"{self.image_id}-logs-{time.strftime('%Y%m%d%H%M')}"
                 root_archive_dir = os.path.join(output_tempdir, archive_name)
                 os.makedirs(root_archive_dir, exist_ok=True)
 
@@ -32,6 +32,14 @@ def clear_env(mocker):
     mocker.patch("botocore.session.Session.get_scoped_config", return_value={})
 
 
+@pytest.fixture(autouse=True)
+def cli_model_cache_file(mocker, tmp_path):
+    """Keep the CLI model cache written by the tests out of the home directory."""
+    cache_file = tmp_path / "cli-model-cache" / "pcluster-cli-model.json"
+    mocker.patch("pcluster.cli.model.get_model_cache_file", return_value=str(cache_file))
+    return cache_file
+
+
 @pytest.fixture(autouse=True)
 def reset_aws_api():
     """Reset AWSApi singleton to remove dependencies between tests."""
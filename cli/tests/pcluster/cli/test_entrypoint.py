@@ -18,6 +18,14 @@ class TestParallelClusterCli:
 
         assert_out_err(expected_out=(test_datadir / "pcluster-help.txt").read_text().strip(), expected_err="")
 
+    def test_version(self, mocker, run_cli, assert_out_err):
+        mocker.patch("pcluster.utils.get_installed_version", return_value="3.10.0")
+        load_model_mock = mocker.patch("pcluster.cli.model.load_cached_model")
+        run_cli(["pcluster", "version"], expect_failure=False)
+
+        assert_out_err(expected_out='{\n  "version": "3.10.0"\n}', expected_err="")
+        load_model_mock.assert_not_called()
+
     def test_no_command(self, test_datadir, run_cli, assert_out_err):
         command = ["pcluster"]
         run_cli(command, expect_failure=True)
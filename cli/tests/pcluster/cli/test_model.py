@@ -6,10 +6,13 @@
 #  OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions and
 #  limitations under the License.
 
+import json
+
 import pytest
 from assertpy import assert_that
 
-from pcluster.cli.entrypoint import ParameterException, gen_parser
+import pcluster.cli.model
+from pcluster.cli.entrypoint import ParameterException, _selected_operations, gen_parser
 
 
 def _model(params):
@@ -93,3 +96,68 @@ class TestCliModel:
         path = str(test_datadir / "notfound")
         with pytest.raises(ParameterException):
             _run_model(model, ["op", "--file", path])
+
+    @pytest.mark.parametrize(
+        "sys_args, expected",
+        [
+            ([], None),
+            (["-h"], set()),
+            (["--help"], set()),
+            (["--help", "list-clusters"], set()),
+            (["--unknown"], None),
+            (["list-clusters"], {"list-clusters"}),
+            (["list-clusters", "--region", "eu-west-1"], {"list-clusters"}),
+            (["ssh", "-h"], {"ssh"}),
+        ],
+    )
+    def test_selected_operations(self, sys_args, expected):
+        assert_that(_selected_operations(sys_args)).is_equal_to(expected)
+
+    def test_gen_parser_populates_selected_operations(self, identity_dispatch):
+        param = {"body": False, "name": "query-param", "required": False, "type": "string"}
+        model = {
+            "op": {"func": "", "body_name": "body", "params": [param]},
+            "other-op": {"func": "", "body_name": "body", "params": [param]},
+        }
+        _parser, parser_map = gen_parser(model, operations={"op"})
+        assert_that(parser_map["op"].parse_args(["--query-param", "test"]).query_param).is_equal_to("test")
+        with pytest.raises(SystemExit):
+            parser_map["other-op"].parse_args(["--query-param", "test"])
+
+
+class TestLoadCachedModel:
+    def test_load_cached_model(self, mocker, cli_model_cache_file):
+        expected_model = pcluster.cli.model.load_model(pcluster.cli.model.package_spec())
+
+        # The first load parses the specification and writes the cache, creating its directory
+        assert_that(pcluster.cli.model.load_cached_model()).is_equal_to(expected_model)
+        assert_that(cli_model_cache_file.exists()).is_true()
+
+        # Subsequent loads are served from the cache
+        load_model_spy = mocker.spy(pcluster.cli.model, "load_model")
+        assert_that(pcluster.cli.model.load_cached_model()).is_equal_to(expected_model)
+        load_model_spy.assert_not_called()
+
+        # A corrupted cache is rebuilt
+        cli_model_cache_file.write_text("not json")
+        assert_that(pcluster.cli.model.load_cached_model()).is_equal_to(expected_model)
+        assert_that(load_model_spy.call_count).is_equal_to(1)
+
+        # A cache written by another ParallelCluster version is rebuilt
+        mocker.patch("pcluster.cli.model.get_installed_version", return_value="0.0.0")
+        assert_that(pcluster.cli.model.load_cached_model()).is_equal_to(expected_model)
+        assert_that(load_model_spy.call_count).is_equal_to(2)
+
+        # A cache pointing to functions outside of the API controllers is rejected
+        cache = json.loads(cli_model_cache_file.read_text())
+        cache["model"]["list-clusters"]["func"] = "os.system"
+        cli_model_cache_file.write_text(json.dumps(cache))
+        assert_that(pcluster.cli.model.load_cached_model()).is_equal_to(expected_model)
+        assert_that(load_model_spy.call_count).is_equal_to(3)
+
+    def test_load_cached_model_write_failure(self, mocker, cli_model_cache_file):
+        mocker.patch("pcluster.cli.model.json.dump", side_effect=TypeError("not serializable"))
+        expected_model = pcluster.cli.model.load_model(pcluster.cli.model.package_spec())
+
+        assert_that(pcluster.cli.model.load_cached_model()).is_equal_to(expected_model)
+        assert_that(list(cli_model_cache_file.parent.iterdir())).is_empty()